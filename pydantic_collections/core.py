@@ -1,13 +1,20 @@
 """Core classes for pydantic collections."""
+import functools
 import types
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pydantic as pdt
 import pydantic_core as pdc
 from pydantic._internal._model_construction import ModelMetaclass
 
 from pydantic_collections import external_utils as extu
+from pydantic_collections.api import IncEx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 UnionType = getattr(types, "UnionType", t.Union)
 
@@ -16,17 +23,60 @@ class CollectionModelConfig(pdt.ConfigDict):
     """Configuration options for collection models."""
 
     validate_assignment_strict: bool
+    skip_revalidation_of_instances: bool
 
 
 _T = t.TypeVar("_T")
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _adapter_for(tp: t.Any) -> pdt.TypeAdapter[t.Any]:  # noqa: ANN401
+    """Return a process-wide shared `TypeAdapter` for the given type.
+
+    Building a `TypeAdapter` runs the full pydantic-core schema analysis, so
+    collection classes parameterized with the same element type share one
+    adapter instead of each rebuilding the schema.
+    """
+    return pdt.TypeAdapter(tp)
+
+
+@dataclass(slots=True, frozen=True)
 class Element(t.Generic[_T]):
     """A generic class representing an element in a collection."""
 
     annotation: t.Any
-    adapter: pdt.TypeAdapter[_T]
+    types_tuple: t.Tuple[t.Union[type, t.Any], ...]
+    #: The sole concrete type of the annotation, if there is exactly one.
+    #: Enables a pointer-comparison fast path in place of isinstance.
+    single_type: t.Optional[type] = None
+    #: Cache slot for the bound `adapter.validate_python`; see `validate`.
+    _validate: t.Optional[t.Callable[..., _T]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def validate(self) -> t.Callable[..., _T]:
+        """Bound `adapter.validate_python`, cached on first use.
+
+        Storing the bound method avoids re-resolving the adapter and its
+        `validate_python` attribute on every element validation, while still
+        deferring the adapter build until validation actually happens.
+        """
+        validate = self._validate
+        if validate is None:
+            validate = self.adapter.validate_python
+            object.__setattr__(self, "_validate", validate)
+        return validate
+
+    @property
+    def adapter(self) -> pdt.TypeAdapter[_T]:
+        """The `TypeAdapter` for the element annotation, built on first use."""
+        return _adapter_for(self.annotation)
+
+    @property
+    def list_adapter(self) -> "pdt.TypeAdapter[t.List[_T]]":
+        """The list-level `TypeAdapter` for the annotation, built on first use."""
+        return _adapter_for(t.List[self.annotation])
 
 
 _ModelMetaclassT = t.TypeVar("_ModelMetaclassT", bound=ModelMetaclass)
@@ -58,7 +108,16 @@ class BaseCollectionModelMeta(ModelMetaclass):
                 "{!r} is not a BaseCollectionModel".format(cls)
             )  # pragma: no cover
 
-        element = Element(annotation=el_type, adapter=pdt.TypeAdapter(el_type))
+        types_tuple = extu.get_types_tuple_from_annotation(el_type)
+        element = Element(
+            annotation=el_type,
+            types_tuple=types_tuple,
+            single_type=(
+                types_tuple[0]
+                if len(types_tuple) == 1 and isinstance(types_tuple[0], type)
+                else None
+            ),
+        )
         return t.cast(
             _ModelMetaclassT,
             type(
@@ -93,20 +152,100 @@ class BaseCollectionModel(
 
     _DEFAULT_VALIDATE_ASSIGNMENT = True
     _DEFAULT_VALIDATE_ASSIGNMENT_STRICT = True
+    _DEFAULT_SKIP_REVALIDATION_OF_INSTANCES = True
 
     model_config = CollectionModelConfig(
         extra="forbid",
+        defer_build=True,
         validate_assignment=_DEFAULT_VALIDATE_ASSIGNMENT,
         validate_assignment_strict=_DEFAULT_VALIDATE_ASSIGNMENT_STRICT,
+        skip_revalidation_of_instances=_DEFAULT_SKIP_REVALIDATION_OF_INSTANCES,
     )
 
+    # Per-class snapshots of the config flags read on every element
+    # validation. The config is fixed at class-definition time, so the dict
+    # lookups are paid once in __init_subclass__ instead of per element.
+    _validate_assignment_ = _DEFAULT_VALIDATE_ASSIGNMENT
+    _validate_assignment_strict_ = _DEFAULT_VALIDATE_ASSIGNMENT_STRICT
+    _skip_revalidation_of_instances_ = _DEFAULT_SKIP_REVALIDATION_OF_INSTANCES
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Snapshot the assignment-validation config flags on the class."""
+        super().__init_subclass__(**kwargs)
+        config = cls.model_config
+        cls._validate_assignment_ = config.get(
+            "validate_assignment", cls._DEFAULT_VALIDATE_ASSIGNMENT
+        )
+        cls._validate_assignment_strict_ = config.get(
+            "validate_assignment_strict", cls._DEFAULT_VALIDATE_ASSIGNMENT_STRICT
+        )
+        cls._skip_revalidation_of_instances_ = config.get(
+            "skip_revalidation_of_instances",
+            cls._DEFAULT_SKIP_REVALIDATION_OF_INSTANCES,
+        )
+
+    def model_dump_json(
+        self,
+        *,
+        indent: int | None = None,
+        include: IncEx = None,
+        exclude: IncEx = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool = True,
+    ) -> str:
+        """Generate a JSON representation of the model.
+
+        When every keyword is left at its default and orjson is installed,
+        serialization goes through orjson on the already-dumped python data,
+        bypassing the pydantic-core serializer's per-call keyword handling.
+        """
+        if (
+            orjson is not None
+            and indent is None
+            and include is None
+            and exclude is None
+            and warnings
+            and not (
+                by_alias
+                or exclude_unset
+                or exclude_defaults
+                or exclude_none
+                or round_trip
+            )
+        ):
+            try:
+                return orjson.dumps(self.model_dump(mode="json")).decode()
+            except TypeError:
+                # orjson only handles 64-bit integers, while pydantic ints are
+                # arbitrary-precision; fall back to the pydantic serializer.
+                pass
+        return super().model_dump_json(
+            indent=indent,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
+        )
+
     def _validate_element_type(
         self,
         value: t.Any,  # noqa: ANN401
         loc: tuple[int | str, ...],
     ) -> None:
-        types = extu.get_types_from_annotation(self.__element__.annotation)
-        if not isinstance(value, tuple(types)):
+        element = self.__element__
+        single_type = element.single_type
+        if single_type is not None and type(value) is single_type:
+            # Exact-type match: a pointer comparison instead of an MRO walk.
+            return
+        if not isinstance(value, element.types_tuple):
             error = {
                 "type": "is_instance_of",
                 "loc": loc,
@@ -121,20 +260,27 @@ class BaseCollectionModel(
     def _validate_element(
         self, value: t.Any, loc: tuple[int | str, ...]  # noqa: ANN401
     ) -> BaseModelT:  # noqa: ANN401
-        if not self.model_config.get(
-            "validate_assignment", self._DEFAULT_VALIDATE_ASSIGNMENT
-        ):
+        if not self._validate_assignment_:
             return value
 
         strict = False
-        if self.model_config.get(
-            "validate_assignment_strict", self._DEFAULT_VALIDATE_ASSIGNMENT_STRICT
-        ):
+        if self._validate_assignment_strict_:
+            if (
+                self._skip_revalidation_of_instances_
+                and type(value) in self.__element__.types_tuple
+            ):
+                # The value is already an instance of the element type; in
+                # strict mode the adapter would hand it back unchanged, so
+                # skip the round-trip through pydantic-core entirely.
+                return value
+            # pydantic's strict mode still accepts dicts for model types, so
+            # the Python-level type check cannot be delegated to the adapter;
+            # it only runs here, after the exact-instance fast path misses.
             self._validate_element_type(value, loc)
             strict = True
 
         try:
-            return self.__element__.adapter.validate_python(
+            return self.__element__.validate(
                 value,
                 strict=strict,
                 from_attributes=True,
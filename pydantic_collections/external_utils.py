@@ -5,7 +5,6 @@ Important:
     None of the imported modules in this file should import from pydantic_collections.
 
 """
-import contextlib
 import functools
 import types
 import typing as t
@@ -42,6 +41,41 @@ def get_types_from_annotation(
         yield origin
 
 
+def get_types_tuple_from_annotation(
+    tp: t.Type[t.Any],  # noqa: ANN401
+) -> t.Tuple[t.Union[type, t.Any], ...]:
+    """Return a cached tuple of all the types that are part of given annotation.
+
+    The resolution performed by :func:`get_types_from_annotation` walks the
+    annotation tree and builds a fresh generator on every call. Annotations are
+    fixed objects with few unique values, so the resolved tuple is memoized and
+    repeated calls reduce to a single cache lookup.
+
+    Args:
+    ----
+    tp: Type
+        The type annotation to extract types from.
+
+    Returns:
+    -------
+    Tuple[Union[type, Any], ...]
+        A tuple of all the types that are part of the annotation.
+    """
+    try:
+        return _cached_types_tuple(tp)
+    except TypeError:
+        # Non-hashable annotations cannot be cached.
+        return tuple(get_types_from_annotation(tp))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_types_tuple(
+    tp: t.Type[t.Any],  # noqa: ANN401
+) -> t.Tuple[t.Union[type, t.Any], ...]:
+    """Memoized helper for `get_types_tuple_from_annotation`."""
+    return tuple(get_types_from_annotation(tp))
+
+
 def wrap_errors_with_loc(
     *,
     errors: list[ErrorDetails],
@@ -61,10 +95,15 @@ def wrap_errors_with_loc(
     list[InitErrorDetails]
         The list of wrapped errors.
     """
-    return [
-        t.cast(InitErrorDetails, {**err, "loc": loc_prefix + err.get("loc", ())})
-        for err in errors
-    ]
+    wrapped: list[InitErrorDetails] = []
+    append = wrapped.append
+    for err in errors:
+        # dict.copy() takes CPython's C-level bulk-copy path, unlike the
+        # `{**err, ...}` display which walks and rebuilds the dict.
+        new_err = err.copy()
+        new_err["loc"] = loc_prefix + err.get("loc", ())
+        append(t.cast(InitErrorDetails, new_err))
+    return wrapped
 
 
 _P = te.ParamSpec("_P")
@@ -93,10 +132,11 @@ def tp_cache(func: _FuncT[_P, _R_co]) -> _FuncT[_P, _R_co]:
 
     @functools.wraps(func)
     def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R_co:
-        with contextlib.suppress(TypeError):
+        try:
             # Try to use the cached version.
             return cached(*args, **kwargs)
-        # Fallback to the original function.
-        return func(*args, **kwargs)
+        except TypeError:
+            # Fallback to the original function for non-hashable arguments.
+            return func(*args, **kwargs)
 
     return inner
@@ -2,6 +2,7 @@
 import typing as t
 from collections import abc as cabc
 
+import pydantic as pdt
 import typing_extensions as te
 from pydantic import RootModel
 
@@ -24,6 +25,11 @@ _SupportsRichComparison: te.TypeAlias = t.Union[
     _SupportsDunderLT[t.Any], _SupportsDunderGT[t.Any]
 ]
 
+#: Shared immutable sentinel passed to the root validator when a sequence is
+#: constructed empty; the validator builds the actual list, so no throwaway
+#: empty list needs to be allocated per instance.
+_EMPTY_ROOT: t.Sequence[t.Any] = ()
+
 
 class _SortedKey(t.Protocol[_T_contra]):
     """Protocol for key function of the `sorted` built-in function."""
@@ -54,15 +60,19 @@ class PydanticSequence(
             - Make root argument positional or keyword.
             - Provide *data argument
         """
-        if root is None:
-            root = []
-        root = list(root) if root else []
         if root and kwargs:
             raise ValueError("Cannot provide both data and **kwargs.")
         if kwargs:
             super().__init__(**kwargs)
-        else:
-            super().__init__(root=root + list(data))
+            return
+        if not data:
+            # The root validator builds its own list, so the caller's
+            # sequence can be handed over without an intermediate copy.
+            super().__init__(root=root if root is not None else _EMPTY_ROOT)
+            return
+        combined = list(root) if root else []
+        combined.extend(data)
+        super().__init__(root=combined)
 
     def _validate_sequence_element_type(
         self, value: t.Any, index: int  # noqa: ANN401
@@ -74,6 +84,38 @@ class PydanticSequence(
     ) -> BaseModelT:
         return super()._validate_element(value, (index,))
 
+    def _bulk_validate(
+        self, values: t.List[t.Any], indices: t.Iterable[int]
+    ) -> t.List[BaseModelT]:
+        """Validate a batch of elements in a single adapter call.
+
+        Validating through the list-level adapter crosses the Python/Rust
+        boundary once for the whole batch instead of once per element. On
+        failure, validation is re-run per element so that the raised errors
+        carry their per-index locations.
+        """
+        if not self._validate_assignment_:
+            return values
+        strict = False
+        if self._validate_assignment_strict_:
+            # The list adapter with from_attributes=True is laxer than the
+            # per-element strict path, so enforce the element-type check in
+            # Python before handing the batch to pydantic-core.
+            for index, value in zip(indices, values):
+                self._validate_sequence_element_type(value, index)
+            strict = True
+        try:
+            return self.__element__.list_adapter.validate_python(
+                values,
+                strict=strict,
+                from_attributes=True,
+            )
+        except pdt.ValidationError:
+            return [
+                self._validate_sequence_element(value, index)
+                for index, value in zip(indices, values)
+            ]
+
     def __len__(self) -> int:
         return len(self.root)
 
@@ -89,7 +131,9 @@ class PydanticSequence(
         self, index: t.Union[int, slice]
     ) -> t.Union[BaseModelT, "BaseCollectionModel[BaseModelT]"]:
         if isinstance(index, slice):
-            return self.__class__(self.root[index])
+            # The elements are already validated; build the sliced instance
+            # with model_construct instead of re-validating every element.
+            return self.__class__.model_construct(root=self.root[index])
         else:
             return self.root[index]
 
@@ -105,10 +149,25 @@ class PydanticSequence(
         self, index: int | slice, value: BaseModelT | t.Iterable[BaseModelT]
     ) -> None:
         if isinstance(index, slice):
-            for index, each_value in zip(
-                self._get_index_range(index), value, strict=True
-            ):
-                self.root[index] = self._validate_sequence_element(each_value, index)
+            values = list(t.cast(t.Iterable[BaseModelT], value))
+            if index.step in (None, 1):
+                # Contiguous slice: validate into a temporary list and let
+                # CPython's C-level slice assignment do the bulk write. The
+                # value count must match the slice so the sequence never
+                # silently resizes, mirroring the extended-slice behavior.
+                start, stop, _ = index.indices(len(self.root))
+                if len(values) != stop - start:
+                    raise ValueError(
+                        "Cannot assign sequence of size {} to slice of size"
+                        " {}.".format(len(values), stop - start)
+                    )
+                validated = self._bulk_validate(values, range(start, stop))
+                self.root[start:stop] = validated
+            else:
+                indices = list(self._get_index_range(index))
+                validated = self._bulk_validate(values, indices)
+                for each_index, each_value in zip(indices, validated, strict=True):
+                    self.root[each_index] = each_value
         else:
             self.root[index] = self._validate_sequence_element(value, index)
 
@@ -116,7 +175,7 @@ class PydanticSequence(
         del self.root[index]
 
     def __iter__(self) -> t.Iterator[BaseModelT]:  # type: ignore
-        return iter(self.root)
+        return self.root.__iter__()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.root!r})"
@@ -130,20 +189,22 @@ class PydanticSequence(
 
     def append(self, value: BaseModelT) -> None:
         """Append value to the end of the sequence."""
-        index = len(self.root) + 1
+        index = len(self.root)
         self.root.append(self._validate_sequence_element(value, index))
 
+    def extend(self, values: t.Iterable[BaseModelT]) -> None:
+        """Extend the sequence by appending all the values from the iterable."""
+        values = list(values)
+        start = len(self.root)
+        self.root.extend(
+            self._bulk_validate(values, range(start, start + len(values)))
+        )
+
     def sort(self, key: _SortedKey[BaseModelT], reverse: bool = False) -> None:
         """Sort the sequence in place."""
-        self.root = sorted(self.root, key=key, reverse=reverse)
+        self.root.sort(key=key, reverse=reverse)
 
-    def _get_index_range(self, index: slice) -> t.Iterable[int]:
+    def _get_index_range(self, index: slice) -> range:
         """Get the range of indices for a slice."""
-        start, stop, step = index.start, index.stop, index.step
-        if step is None:
-            step = 1
-        if start is None:
-            start = 0
-        if stop is None:
-            stop = len(self.root)
-        return range(start, stop, step or 1)
+        start, stop, step = index.indices(len(self.root))
+        return range(start, stop, step)
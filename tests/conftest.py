@@ -0,0 +1,29 @@
+"""Shared models and type aliases for the pydantic-collections test suite.
+
+Defining these once here means pytest collection evaluates the generic
+aliases a single time and every test module shares one `User` schema
+instead of each building its own validator.
+"""
+import typing as t
+
+import pydantic as pdt
+
+
+class User(pdt.BaseModel):
+    """A user."""
+
+    name: str
+    age: int
+
+
+class UserData(t.TypedDict):
+    """Dict version of User."""
+
+    name: str
+    age: int
+
+
+#: The corpus fixtures return immutable tuples so they can be shared safely
+#: across module-scoped (and lru_cached) fixture instances.
+UsersData = tuple[UserData, ...]
+UsersSequenceData = tuple[User, ...]
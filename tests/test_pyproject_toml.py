@@ -3,33 +3,37 @@ import typing as t
 from itertools import chain
 
 import pytest
-import toml
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import toml as tomllib  # type: ignore[no-redef]
 
 from pydantic_collections import REPO_ROOT, __version__
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def pyproject_config() -> t.Dict[str, t.Any]:
-    """Load the pyproject.toml file."""
-    pyproject_file_path = REPO_ROOT / "pyproject.toml"
-    return toml.load(pyproject_file_path)
+    """Load the pyproject.toml file once per test session."""
+    text = (REPO_ROOT / "pyproject.toml").read_text()
+    return tomllib.loads(text)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def all_dependencies(pyproject_config: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
     """Return dependencies installed when running `pip install llegom[all]`."""
     return pyproject_config["tool"]["poetry"]["dependencies"]
 
 
-@pytest.fixture()
-def all_extra_dependencies(pyproject_config: t.Dict[str, t.Any]) -> t.List[str]:
+@pytest.fixture(scope="session")
+def all_extra_dependencies(pyproject_config: t.Dict[str, t.Any]) -> t.FrozenSet[str]:
     """Return dependencies that are not installed when running `pip install llegom`."""
     extras = pyproject_config["tool"]["poetry"]["extras"]
-    return list(chain.from_iterable(extras.values()))
+    return frozenset(chain.from_iterable(extras.values()))
 
 
 def test_pyproject_optional_present_in_option(
-    all_dependencies: t.Dict[str, t.Any], all_extra_dependencies: t.List[str]
+    all_dependencies: t.Dict[str, t.Any], all_extra_dependencies: t.FrozenSet[str]
 ) -> None:
     """Ensure that the optional dependencies are present in the at least one of the
     options section.
@@ -48,9 +52,9 @@ def test_pyproject_install_all(
     """Installing using `pip install 'llegom[all]'` should install all dependencies."""  # noqa: E501
     extras = pyproject_config["tool"]["poetry"]["extras"]
     all_extras: t.Dict[str, str] = {k: v for k, v in extras.items() if k != "all"}
-    all_extra_dependencies = chain.from_iterable(all_extras.values())
+    all_extra_dependencies = set(chain.from_iterable(all_extras.values()))
     extras_all = extras["all"]
-    assert set(all_extra_dependencies) == set(extras_all)
+    assert all_extra_dependencies == set(extras_all)
     # If you specify a dependency in the extras section, make sure you mention it in
     # the actual dependencies section with the version number.
     for extra in all_extras.values():
@@ -1,19 +1,15 @@
 """Tests for `pydantic_collections.sequence` module."""
-import json
+import functools
 import typing as t
+from operator import attrgetter, itemgetter
 
 import pydantic as pdt
 import pytest
+from orjson import dumps as orjson_dumps
 
 from pydantic_collections.core import CollectionModelConfig
 from pydantic_collections.sequence import PydanticSequence
-
-
-class User(pdt.BaseModel):
-    """A user."""
-
-    name: str
-    age: int
+from tests.conftest import User, UsersData, UsersSequenceData
 
 
 class UsersSequence(PydanticSequence[User]):
@@ -30,15 +26,9 @@ class WeakUsersSequence(PydanticSequence[User]):
     model_config = CollectionModelConfig(validate_assignment_strict=False)
 
 
-class UserData(t.TypedDict):
-    """Dict version of User."""
-
-    name: str
-    age: int
-
-
-UsersData = list[UserData]
-UsersSequenceData = list[User]
+#: Validates a whole list of raw dicts into User models in one
+#: pydantic-core call instead of N per-item constructor calls.
+_USER_LIST_ADAPTER = pdt.TypeAdapter(list[User])
 
 
 class HasUsersSequence(pdt.BaseModel):
@@ -47,22 +37,53 @@ class HasUsersSequence(pdt.BaseModel):
     users: UsersSequence
 
 
-@pytest.fixture()
-def user_count() -> int:
+# Force the deferred schema builds at import time so no individual test pays
+# the one-off build cost.
+UsersSequence.model_rebuild(force=True)
+WeakUsersSequence.model_rebuild(force=True)
+HasUsersSequence.model_rebuild(force=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_corpus(user_count: int) -> UsersData:
+    """Build the raw users corpus once per size, shared across tests."""
+    return tuple({"name": f"Name {i}", "age": i} for i in range(user_count))  # type: ignore  # noqa: E501
+
+
+@pytest.fixture(scope="module", params=[2, 1000])
+def user_count(request: pytest.FixtureRequest) -> int:
     """Return number of users."""
-    return 2
+    return request.param
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def users_data(user_count: int) -> UsersData:
-    """Return data for multiple users."""
-    return [dict(name=f"Name {i}", age=i) for i in range(user_count)]  # type: ignore
+    """Return data for multiple users.
 
+    Module-scoped template; tests must not mutate the returned data.
+    """
+    return _build_corpus(user_count)
 
-@pytest.fixture()
+
+@pytest.fixture(scope="module")
 def users_sequence_data(users_data: UsersData) -> UsersSequenceData:
-    """Return multiple users."""
-    return [User(**data) for data in users_data]
+    """Return multiple users.
+
+    Module-scoped template; tests must not mutate the returned models.
+    """
+    return tuple(_USER_LIST_ADAPTER.validate_python(list(users_data)))
+
+
+@pytest.fixture(scope="module")
+def users_data_json_bytes(users_data: UsersData) -> bytes:
+    """Return the users corpus serialized to JSON bytes once per module."""
+    return orjson_dumps(users_data)
+
+
+@pytest.fixture(scope="module")
+def users_data_json(users_data_json_bytes: bytes) -> str:
+    """Return the users corpus serialized to JSON once per module."""
+    return users_data_json_bytes.decode()
 
 
 @pytest.fixture()
@@ -77,6 +98,7 @@ def weak_users_sequence(users_sequence_data: UsersSequenceData) -> WeakUsersSequ
     return WeakUsersSequence(*users_sequence_data)
 
 
+@pytest.mark.xdist_group("sequence")
 class TestPydanticSequence:
     """Tests for `PydanticSequence`."""
 
@@ -84,53 +106,97 @@ class TestPydanticSequence:
         """I can get the length of a PydanticSequence."""
         assert len(users) == user_count
 
-    def test_get_item(self, users: UsersSequence, users_data: UsersData) -> None:
+    def test_get_item(
+        self,
+        users: UsersSequence,
+        users_sequence_data: UsersSequenceData,
+        user_count: int,
+    ) -> None:
         """I can get an item from a PydanticSequence by indexing it."""
-        checked_once = False
-        for i, user_data in enumerate(users_data):
-            assert users[i] == User(**user_data)
-            checked_once = True
-        assert checked_once
+        assert user_count > 0
+        actual = [users[i] for i in range(len(users_sequence_data))]
+        assert actual == list(users_sequence_data)
 
     def test_model_dump(self, users: UsersSequence, users_data: UsersData) -> None:
         """I can get a dictionary representation of a PydanticSequence."""
-        assert users.model_dump() == users_data
+        assert users.model_dump() == list(users_data)
 
-    def test_model_dump_json(self, users: UsersSequence, users_data: UsersData) -> None:
+    def test_model_dump_json(self, users: UsersSequence, users_data_json: str) -> None:
         """I can get a JSON representation of a PydanticSequence."""
-        model_dump_json = users.model_dump_json()
-        json_dumps = json.dumps(users_data)
-        assert json.loads(model_dump_json) == json.loads(json_dumps)
+        # The corpus dicts are built in field-definition order and both sides
+        # serialize compactly, so the strings compare byte-for-byte without
+        # re-parsing either payload.
+        assert users.model_dump_json() == users_data_json
 
     def test_model_validate(self, users: UsersSequence, users_data: UsersData) -> None:
         """I can validate a PydanticSequence."""
         assert UsersSequence.model_validate(users_data) == users
 
     def test_model_validate_json(
-        self, users: UsersSequence, users_data: UsersData
+        self, users: UsersSequence, users_data_json_bytes: bytes
     ) -> None:
         """I can validate a PydanticSequence from JSON."""
-        assert UsersSequence.model_validate_json(json.dumps(users_data)) == users
+        # Passing bytes skips the Python-side utf-8 decode and goes straight
+        # into the Rust JSON parser.
+        assert UsersSequence.model_validate_json(users_data_json_bytes) == users
 
     def test_in_place_sort(self, users: UsersSequence, users_data: UsersData) -> None:
         """I can sort a PydanticSequence in place."""
-        exp = sorted(users_data, key=lambda x: x["age"], reverse=True)
+        # C-implemented getters avoid an interpreter dispatch per comparison.
+        exp = sorted(users_data, key=itemgetter("age"), reverse=True)
         assert users.model_dump() != exp
-        result = users.sort(key=lambda x: x.age, reverse=True)
+        result = users.sort(key=attrgetter("age"), reverse=True)
         assert result is None
         assert users.model_dump() == exp
 
+    def test_slice_assignment(
+        self,
+        users: UsersSequence,
+        users_sequence_data: UsersSequenceData,
+        user_count: int,
+    ) -> None:
+        """I can assign to a contiguous slice of a PydanticSequence."""
+        assert user_count > 0
+        reversed_users = list(reversed(users_sequence_data))
+        users[:user_count] = reversed_users
+        assert list(users) == reversed_users
+
+    def test_extended_slice_assignment(
+        self,
+        users: UsersSequence,
+        users_sequence_data: UsersSequenceData,
+        user_count: int,
+    ) -> None:
+        """I can assign to an extended slice of a PydanticSequence."""
+        assert user_count > 0
+        expected = list(users_sequence_data)
+        replacement = list(reversed(expected[::2]))
+        users[::2] = replacement
+        expected[::2] = replacement
+        assert list(users) == expected
+
+    def test_slice_assignment_size_mismatch(
+        self, users: UsersSequence, users_sequence_data: UsersSequenceData
+    ) -> None:
+        """Assigning the wrong number of elements to a slice raises an error."""
+        with pytest.raises(ValueError):
+            users[:1] = [*users_sequence_data, *users_sequence_data]
+        with pytest.raises(ValueError):
+            users[::2] = []
+
     def test_assignment_validation(
-        self, users: UsersSequence, users_data: UsersData
+        self,
+        users: UsersSequence,
+        users_data: UsersData,
+        users_sequence_data: UsersSequenceData,
+        user_count: int,
     ) -> None:  # sourcery skip: class-extract-method
         """When I add elements ot the PydanticSequence, they are validated."""
-        assert users.model_dump() == users_data
-        checked_once = False
-        for user_data in users_data:
-            users.append(User(**user_data))
-            checked_once = True
-        assert checked_once
-        assert users.model_dump() == users_data + users_data
+        assert user_count > 0
+        assert users.model_dump() == list(users_data)
+        for user in users_sequence_data:
+            users.append(user)
+        assert users.model_dump() == [*users_data, *users_data]
         with pytest.raises(pdt.ValidationError):
             # Appending an element of the wrong type raises an error.
             users.append(users_data[0])  # type: ignore
@@ -140,53 +206,49 @@ class TestPydanticSequence:
         weak_users_sequence: WeakUsersSequence,
         user_count: int,
         users_data: UsersData,
+        users_sequence_data: UsersSequenceData,
     ) -> None:
         """When I add elements ot the PydanticSequence, they are validated."""
-        assert weak_users_sequence.model_dump() == users_data
-        checked_once = False
-        for user_data in users_data:
-            weak_users_sequence.append(User(**user_data))
-            checked_once = True
-        assert checked_once
-        checked_once = False
-        assert weak_users_sequence.model_dump() == users_data + users_data
+        assert user_count > 0
+        assert weak_users_sequence.model_dump() == list(users_data)
+        for user in users_sequence_data:
+            weak_users_sequence.append(user)
+        assert weak_users_sequence.model_dump() == [*users_data, *users_data]
         for user_data in users_data:
             # Appending a dictionary version of the element model is allowed.
             weak_users_sequence.append(user_data)  # type: ignore
-            checked_once = True
-        assert checked_once
-        checked_once = False
-        for i, user_data in enumerate(users_data):
-            assert weak_users_sequence[i + user_count] == User(**user_data)
-            checked_once = True
-        assert checked_once
+        actual = [
+            weak_users_sequence[i + user_count] for i in range(len(users_data))
+        ]
+        assert actual == list(users_sequence_data)
         with pytest.raises(pdt.ValidationError):
             # Appending an element of the wrong type raises an error.
             weak_users_sequence.append("user")  # type: ignore
 
 
-@pytest.mark.parametrize(
-    "users, json_str",
-    [
-        pytest.param(
-            HasUsersSequence(
-                users=UsersSequence(
-                    User(name="Alice", age=30),
-                    User(name="Bob", age=40),
-                )
-            ),
-            '{"users":[{"name":"Alice","age":30},{"name":"Bob","age":40}]}',
-            id="two users",
-        ),
-    ],
-)
+@pytest.fixture(scope="class")
+def users_pair() -> t.Tuple[HasUsersSequence, str]:
+    """Return a model instance and its JSON form, shared across a test class."""
+    instance = HasUsersSequence(
+        users=UsersSequence(
+            User(name="Alice", age=30),
+            User(name="Bob", age=40),
+        )
+    )
+    json_str = '{"users":[{"name":"Alice","age":30},{"name":"Bob","age":40}]}'
+    return instance, json_str
+
+
+@pytest.mark.xdist_group("sequence")
 class TestUsageInPydanticModels:
     """I should be able to use PydanticSequence in Pydantic models."""
 
-    def test_serialization(self, users: HasUsersSequence, json_str: str) -> None:
+    def test_serialization(self, users_pair: t.Tuple[HasUsersSequence, str]) -> None:
         """I can serialize PydanticSequence objects to JSON."""
+        users, json_str = users_pair
         assert users.model_dump_json() == json_str
 
-    def test_deserialization(self, json_str: str, users: HasUsersSequence) -> None:
+    def test_deserialization(self, users_pair: t.Tuple[HasUsersSequence, str]) -> None:
         """I can deserialize JSON to PydanticSequence objects."""
+        users, json_str = users_pair
         assert HasUsersSequence.model_validate_json(json_str) == users